@@ -1,6 +1,6 @@
 from enum import IntEnum
 from .header import Header
-from .exceptions import UnknownEntryTypeException
+from .exceptions import UnknownEntryTypeException, EntryNameTooLongException
 from datetime import datetime
 from abc import ABC
 
@@ -8,16 +8,25 @@ class Type(IntEnum):
     DIRECTORY = 0x8427
     FILE = 0x8497
 
+# Plain integer type values, avoiding the enum member lookup on hot paths
+_DIRECTORY = Type.DIRECTORY.value
+_FILE = Type.FILE.value
+
 class Entry(ABC):
+    __slots__ = ('name', 'header', 'padding')
+
     PADDING_SIZE = 32
     NAME_SIZE = 448
+    EMPTY_PADDING = bytes(PADDING_SIZE)
+    __EMPTY_NAME = memoryview(bytes(NAME_SIZE))
 
     @staticmethod
-    def deserialize(data):
+    def deserialize(data, offset = 0):
         """Deserialize the next entry from the byte data stream.
 
         Args:
-            data (bytes): The byte data stream containing the remaining entries.
+            data (memoryview): The byte data stream containing the entries.
+            offset (int, optional): The offset within the data stream where the entry starts. Defaults to 0.
 
         Raises:
             UnknownEntryTypeException: Exception is raised when the given entry type was unknown.
@@ -25,68 +34,67 @@ class Entry(ABC):
         Returns:
             File|Directory: The deserialized file or directory entry instance.
         """
-        offset = 0
+        start = offset
 
         # Read header
-        header = Header.deserialize(data[offset:offset + Header.SIZE])
+        header = Header.deserialize(data, offset)
         offset += Header.SIZE
 
         # Read padding
-        padding = Entry.__getPadding(data[offset:offset + Entry.PADDING_SIZE])
+        padding = Entry.__getPadding(data, offset)
         offset += Entry.PADDING_SIZE
 
         # Read name
-        name = Entry.__getName(data[offset:offset + Entry.NAME_SIZE])
+        name = Entry.__getName(data, offset)
         offset += Entry.NAME_SIZE
 
-        # Deserialize file entry
-        if header.type == Type.FILE:
-            entry, entrySize = File.deserialize(header, padding, name, data[offset:])
-            return entry, offset + entrySize
-
-        # Deserialize directory entry
-        if header.type == Type.DIRECTORY:
-            entry, entrySize = Directory.deserialize(header, padding, name, data[offset:])
-            return entry, offset + entrySize
-
         # Unhandled entry
-        raise UnknownEntryTypeException(header.type, name)
+        deserialize = _DESERIALIZERS.get(header.type)
+        if deserialize == None:
+            raise UnknownEntryTypeException(header.type, name)
+
+        # Deserialize file or directory entry
+        entry, entrySize = deserialize(header, padding, name, data, offset)
+        return entry, offset - start + entrySize
 
     @staticmethod
-    def __getPadding(data):
+    def __getPadding(data, offset = 0):
         """Get the padding bytes from the given byte stream.
 
         Args:
-            data (bytes): The data stream starting with the padding bytes.
+            data (memoryview): The data stream containing the padding bytes.
+            offset (int, optional): The offset within the data stream where the padding starts. Defaults to 0.
 
         Returns:
             bytes: The padding bytes retrieved.
         """
-        return data[0:Entry.PADDING_SIZE]
+        return bytes(data[offset:offset + Entry.PADDING_SIZE])
 
     @staticmethod
-    def __getName(data):
+    def __getName(data, offset = 0):
         """Get the entry name from the data stream, right trimming NULL bytes.
 
         Args:
-            data (bytes): The byte stream starting with the name.
+            data (memoryview): The byte stream containing the name.
+            offset (int, optional): The offset within the data stream where the name starts. Defaults to 0.
 
         Returns:
             str: The name retrieved from the byte stream.
         """
-        return data[0:Entry.NAME_SIZE].decode('UTF-8').rstrip('\x00')
+        # Trim the NULL bytes before decoding so the padding is not decoded too
+        return bytes(data[offset:offset + Entry.NAME_SIZE]).rstrip(b'\x00').decode('UTF-8')
 
     def __init__(self,
             name,
             header,
-            padding = (b'\x00' * PADDING_SIZE)
+            padding = EMPTY_PADDING
         ):
         """Initializes an Entry instance.
 
         Args:
             name (str): The name of the entry.
             header (Header): The entry header instance.
-            padding (bytes): A stream of bytes inserted into the padding section of an entry. Defaults to (b'\x00' * PADDING_SIZE).
+            padding (bytes): A stream of bytes inserted into the padding section of an entry. Defaults to EMPTY_PADDING.
         """
         self.name = name
         self.header = header
@@ -98,10 +106,91 @@ class Entry(ABC):
         Returns:
             bytes: The serialized entry instance in byte form.
         """
-        data = self.header.serialize()
-        data += self.padding
-        data += self.name.encode('UTF-8').ljust(Entry.NAME_SIZE, b'\x00')
-        return data
+        data = bytearray(self.serializedSize())
+        self.serializeInto(data)
+        return bytes(data)
+
+    def validate(self):
+        """Validate the entry instance can be serialized.
+
+        Raises:
+            EntryNameTooLongException: Exception is raised when the entry name does not fit within the name field.
+
+        Returns:
+            bytes: The encoded entry name.
+        """
+        name = self.name.encode('UTF-8')
+        if len(name) > Entry.NAME_SIZE:
+            raise EntryNameTooLongException(self)
+        return name
+
+    def serializeInto(self, buffer, offset = 0):
+        """Serialize the entry instance directly into the given writable buffer.
+
+        Args:
+            buffer (bytearray|memoryview): The writable buffer to serialize the entry into.
+            offset (int, optional): The offset within the buffer where the entry is written. Defaults to 0.
+
+        Raises:
+            EntryNameTooLongException: Exception is raised when the entry name does not fit within the name field.
+
+        Returns:
+            int: The number of bytes written to the buffer.
+        """
+        name = self.validate()
+
+        start = offset
+
+        # Write header
+        offset += self.header.serializeInto(buffer, offset)
+
+        # Write padding
+        buffer[offset:offset + Entry.PADDING_SIZE] = self.padding
+        offset += Entry.PADDING_SIZE
+
+        # Write name
+        buffer[offset:offset + len(name)] = name
+        buffer[offset + len(name):offset + Entry.NAME_SIZE] = Entry.__EMPTY_NAME[len(name):]
+        offset += Entry.NAME_SIZE
+
+        return offset - start
+
+    def serializeTo(self, stream):
+        """Serialize the entry instance directly to the given writable stream.
+
+        Args:
+            stream (BufferedWriter): The writable binary stream to serialize the entry to.
+
+        Returns:
+            int: The number of bytes written to the stream.
+        """
+        data = bytearray(Entry.serializedSize(self))
+        Entry.serializeInto(self, data)
+        return stream.write(data)
+
+    def serializedSize(self):
+        """Gets the number of bytes the entry instance occupies when serialized.
+
+        Returns:
+            int: The serialized entry size in bytes.
+        """
+        return Header.SIZE + Entry.PADDING_SIZE + Entry.NAME_SIZE
+
+    def formatModified(self, currentYear = None):
+        """Get the entry modified date in a unix style file listing format.
+        Entries modified before the current year show the year rather than the time.
+
+        Args:
+            currentYear (int, optional): The current year. Defaults to None, where the year is retrieved from the current date.
+
+        Returns:
+            str: The formatted modified date.
+        """
+        currentYear = currentYear if currentYear != None else datetime.now().year
+        modified = self.header.modified
+        if modified.year < currentYear:
+            return modified.strftime('%b %d %Y')
+        return modified.strftime('%b %d %H:%M')
 
     def isFile(self):
         """Is the current entry a file?
@@ -109,7 +198,7 @@ class Entry(ABC):
         Returns:
             bool: Returns true if the current entry is a file.
         """
-        return self.header.type == Type.FILE
+        return self.header.type == _FILE
 
     def isDirectory(self):
         """Is the current entry a directory?
@@ -117,18 +206,21 @@ class Entry(ABC):
         Returns:
             bool: Returns true if the current entry is a directory.
         """
-        return self.header.type == Type.DIRECTORY
+        return self.header.type == _DIRECTORY
 
 class Directory(Entry):
+    __slots__ = ()
+
     @staticmethod
-    def deserialize(header, padding, name, data = b''):
+    def deserialize(header, padding, name, data = b'', offset = 0):
         """Deserialize the directory entry from the byte data stream.
 
         Args:
             header (Header): The deserialized directory entry header.
             padding (bytes): The padding bytes within the directory entry.
             name (str): The directory entry name.
-            data (bytes, optional): The remaining data stream to be deserialized. Defaults to b''.
+            data (memoryview, optional): The data stream to be deserialized. Defaults to b''.
+            offset (int, optional): The offset within the data stream where the directory entry body starts. Defaults to 0.
 
         Returns:
             Directory: The deserialized directory entry instance.
@@ -144,7 +236,7 @@ class Directory(Entry):
             name,
             fileCount = 0,
             header = None,
-            padding = (b'\x00' * Entry.PADDING_SIZE)
+            padding = Entry.EMPTY_PADDING
         ):
         """Initializes a Directory Entry instance.
 
@@ -152,7 +244,7 @@ class Directory(Entry):
             name (str): The name of the directory.
             fileCount (int, optional): The number of files and directories within this directory. Defaults to 0.
             header (header, optional): The directory entry header instance. Defaults to None.
-            padding (bytes, optional): A stream of bytes inserted into the padding section of an entry. Defaults to (b'\x00' * Entry.PADDING_SIZE).
+            padding (bytes, optional): A stream of bytes inserted into the padding section of an entry. Defaults to Entry.EMPTY_PADDING.
         """
         header = header if header != None else Header(Type.DIRECTORY, fileCount)
         super().__init__(name, header, padding)
@@ -163,29 +255,41 @@ class Directory(Entry):
         Returns:
             str: A string containing the modified date and directory name.
         """
-        modified = self.header.modified.strftime('%b %d %H:%M')
-        if self.header.modified.year < datetime.now().year:
-            modified = self.header.modified.strftime('%b %d %Y')
-        return f'd {modified: <12} {0: <6} {self.name}'
+        return self.toString()
+
+    def toString(self, currentYear = None):
+        """Get the directory in a unix style file listing string format.
+
+        Args:
+            currentYear (int, optional): The current year, used to decide whether the modified time or year is shown. Defaults to None, where the year is retrieved from the current date.
+
+        Returns:
+            str: A string containing the modified date and directory name.
+        """
+        return f'd {self.formatModified(currentYear): <12} {0: <6} {self.name}'
 
 class File(Entry):
+    __slots__ = ('__content',)
+
     PAGE_SIZE = 1024
+    __EMPTY_PAGE = memoryview(bytes(PAGE_SIZE))
 
     @staticmethod
-    def deserialize(header, padding, name, data = b''):
+    def deserialize(header, padding, name, data = b'', offset = 0):
         """Deserialize the file entry from the byte data stream.
 
         Args:
             header (Header): The deserialized file entry header.
             padding (bytes): The padding bytes within the file entry.
             name (str): The file entry name.
-            data (bytes, optional): The remaining data stream to be deserialized. Defaults to b''.
+            data (memoryview, optional): The data stream to be deserialized. Defaults to b''.
+            offset (int, optional): The offset within the data stream where the file content starts. Defaults to 0.
 
         Returns:
             File: The deserialized file entry instance.
         """
-        # Read content
-        content = data[:header.size]
+        # Reference the content within the data stream, it is only copied when accessed
+        content = data[offset:offset + header.size]
 
         # Skip padding until alignment
         offset = header.size + File.getContentPaddingSize(header.size)
@@ -208,43 +312,124 @@ class File(Entry):
         Returns:
             int: The number of bytes remaining until the end of the next page.
         """
-        remaining = File.PAGE_SIZE - (contentSize % File.PAGE_SIZE)
-        return 0 if remaining == File.PAGE_SIZE else remaining
+        return (-contentSize) & (File.PAGE_SIZE - 1)
 
     def __init__(self,
             name,
             content = b'', 
             header = None,
-            padding = (b'\x00' * Entry.PADDING_SIZE)
+            padding = Entry.EMPTY_PADDING
         ):
         """Initializes a File Entry instance.
 
         Args:
             name (str): The name of the file.
-            content (bytes, optional): The file binary contents. Defaults to b''.
+            content (bytes|memoryview, optional): The file binary contents. Defaults to b''.
             header (Header, optional): The file entry header instance. Defaults to None.
-            padding (bytes, optional): A stream of bytes inserted into the padding section of an entry. Defaults to (b'\x00' * Entry.PADDING_SIZE).
+            padding (bytes, optional): A stream of bytes inserted into the padding section of an entry. Defaults to Entry.EMPTY_PADDING.
         """
         header = header if header != None else Header(Type.FILE, len(content))
         self.content = content
         super().__init__(name, header, padding)
 
-    def serialize(self):
-        """Serialize the file entry instance to a byte data stream.
+    @property
+    def content(self):
+        """Get the file binary contents.
+        Content referencing the data stream it was deserialized from is copied to bytes on first access.
+        Until then, each untouched file keeps the whole loaded data stream alive, so deleting other entries after loading frees no memory.
 
         Returns:
-            bytes: The serialized file entry instance in byte form.
+            bytes: The file binary contents.
         """
-        self.header.size = len(self.content)
+        if type(self.__content) == memoryview:
+            self.__content = bytes(self.__content)
+        return self.__content
 
-        data = super().serialize()
+    @content.setter
+    def content(self, content):
+        """Set the file binary contents.
+
+        Args:
+            content (bytes|memoryview): The file binary contents.
+        """
+        self.__content = content
 
-        # Append content
+    def __getstate__(self):
+        """Get the file entry state for pickling and copying, copying referenced content to bytes.
+
+        Returns:
+            tuple: The file entry name, header, padding and content.
+        """
+        return (self.name, self.header, self.padding, self.content)
+
+    def __setstate__(self, state):
+        """Restore the file entry state when unpickling and copying.
+
+        Args:
+            state (tuple): The file entry name, header, padding and content.
+        """
+        name, header, padding, content = state
+        Entry.__init__(self, name, header, padding)
+        self.content = content
+
+    def serializeInto(self, buffer, offset = 0):
+        """Serialize the file entry instance directly into the given writable buffer.
+
+        Args:
+            buffer (bytearray|memoryview): The writable buffer to serialize the file entry into.
+            offset (int, optional): The offset within the buffer where the file entry is written. Defaults to 0.
+
+        Returns:
+            int: The number of bytes written to the buffer.
+        """
+        self.header.size = len(self.__content)
+
+        start = offset
+        offset += super().serializeInto(buffer, offset)
+
+        # Write content
         if self.header.size > 0:
-            data += self.content
+            buffer[offset:offset + self.header.size] = self.__content
+            offset += self.header.size
+
             # Page-align content with padding
-            data += (b'\x00' * File.getContentPaddingSize(self.header.size))
-        return data
+            paddingSize = File.getContentPaddingSize(self.header.size)
+            buffer[offset:offset + paddingSize] = File.__EMPTY_PAGE[:paddingSize]
+            offset += paddingSize
+        return offset - start
+
+    def serializeTo(self, stream):
+        """Serialize the file entry instance directly to the given writable stream.
+        The content is written as-is rather than being copied into an intermediate buffer.
+
+        Args:
+            stream (BufferedWriter): The writable binary stream to serialize the file entry to.
+
+        Returns:
+            int: The number of bytes written to the stream.
+        """
+        self.header.size = len(self.__content)
+
+        size = super().serializeTo(stream)
+
+        # Write content
+        if self.header.size > 0:
+            size += stream.write(self.__content)
+
+            # Page-align content with padding
+            size += stream.write(File.__EMPTY_PAGE[:File.getContentPaddingSize(self.header.size)])
+        return size
+
+    def serializedSize(self):
+        """Gets the number of bytes the file entry instance occupies when serialized.
+
+        Returns:
+            int: The serialized file entry size in bytes, including the page-aligned content.
+        """
+        size = len(self.__content)
+        if size == 0:
+            return super().serializedSize()
+        return super().serializedSize() + size + File.getContentPaddingSize(size)
 
     def __str__(self):
         """Get the file in a unix style file listing string format.
@@ -252,7 +437,24 @@ class File(Entry):
         Returns:
             str: A string containing the modified date, file size and file name.
         """
-        modified = self.header.modified.strftime('%b %d %H:%M')
-        if self.header.modified.year < datetime.now().year:
-            modified = self.header.modified.strftime('%b %d %Y')
-        return f'- {modified: <12} {self.header.size: <6} {self.name: <16}'
\ No newline at end of file
+        return self.toString()
+
+    def toString(self, currentYear = None):
+        """Get the file in a unix style file listing string format.
+
+        Args:
+            currentYear (int, optional): The current year, used to decide whether the modified time or year is shown. Defaults to None, where the year is retrieved from the current date.
+
+        Returns:
+            str: A string containing the modified date, file size and file name.
+        """
+        return f'- {self.formatModified(currentYear): <12} {self.header.size: <6} {self.name: <16}'
+
+# Entry type to deserializer dispatch for Entry.deserialize
+_DESERIALIZERS = {
+    _DIRECTORY: Directory.deserialize,
+    _FILE: File.deserialize,
+}
+
+# Content padding is computed with a bitmask, which requires a power of two page size
+assert File.PAGE_SIZE & (File.PAGE_SIZE - 1) == 0
@@ -41,4 +41,17 @@ class EntryNotAFileException(PSUException):
         self.entry = entry
 
         message = message if message != None else f'Entry "{entry.name}" is not a file'
+        super().__init__(message)
+
+class EntryNameTooLongException(PSUException):
+    def __init__(self, entry, message = None):
+        """Exception raised when an entry name does not fit within the entry name field.
+
+        Args:
+            entry (Entry): The entry which has a name that is too long.
+            message (string, optional): A custom message to be displayed in the exception. Defaults to None.
+        """
+        self.entry = entry
+
+        message = message if message != None else f'Entry name "{entry.name}" is too long'
         super().__init__(message)
\ No newline at end of file
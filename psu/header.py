@@ -27,25 +27,29 @@ class Header:
         timestamp modified; // 0x18
     }; // 0x20
     """
+    __slots__ = ('type', 'size', '__created', '__modified', 'sectorAddress', 'unk1', 'unk2', 'unk3')
+
     FORMAT = '<HHI6BHHHI6BH'
-    SIZE = 0x20
+    STRUCT = struct.Struct(FORMAT)
+    SIZE = STRUCT.size
 
     @staticmethod
-    def deserialize(data):
+    def deserialize(data, offset = 0):
         """Deserialized the header bytes from the given data stream into a header instance.
 
         Args:
-            data (bytes): The data stream of bytes containing the entry header.
+            data (bytes|memoryview): The data stream of bytes containing the entry header.
+            offset (int, optional): The offset within the data stream where the header starts. Defaults to 0.
 
         Returns:
             Header: The deserialized header instance.
         """
-        header = struct.unpack(Header.FORMAT, data)
+        header = Header.STRUCT.unpack_from(data, offset)
         return Header(
             header[0], # type
             header[2], # size
-            datetime(header[9], header[8], header[7], header[6], header[5], header[4]), # created
-            datetime(header[19], header[18], header[17], header[16], header[15], header[14]), # modified
+            header[4:10],  # created
+            header[14:20], # modified
             header[10], # sector
             header[1],  # unk1
             header[11], # unk2
@@ -67,8 +71,8 @@ class Header:
         Args:
             type (Type): The entry type.
             size (int): The entry size. For a directory this is the number of files and directories. For a file this is the content size.
-            created (datetime, optional): The date and time the entry was created. Defaults to datetime.now().
-            modified (datetime, optional): The date and time the entry was last modified. Defaults to datetime.now().
+            created (datetime|tuple, optional): The date and time the entry was created, or the raw timestamp fields. Defaults to datetime.now().
+            modified (datetime|tuple, optional): The date and time the entry was last modified, or the raw timestamp fields. Defaults to datetime.now().
             sectorAddress (int, optional): The start sector address to write the file content to in the memory card. Defaults to 0.
             unk1 (int, optional): Unknown, but always appear to be 0. Defaults to 0.
             unk2 (int, optional): Unknown. Defaults to 0.
@@ -83,32 +87,104 @@ class Header:
         self.unk2 = unk2
         self.unk3 = unk3
 
+    @staticmethod
+    def __toTimestamp(value):
+        """Converts the given date and time to the raw timestamp fields.
+
+        Args:
+            value (datetime|tuple): The date and time, or the raw timestamp fields.
+
+        Returns:
+            tuple: The raw timestamp fields in the order (seconds, minutes, hours, days, months, year).
+        """
+        if type(value) == tuple:
+            return value
+        return (value.second, value.minute, value.hour, value.day, value.month, value.year)
+
+    @staticmethod
+    def __toDatetime(timestamp):
+        """Converts the given raw timestamp fields to a date and time.
+
+        Args:
+            timestamp (tuple): The raw timestamp fields in the order (seconds, minutes, hours, days, months, year).
+
+        Returns:
+            datetime: The date and time of the timestamp.
+        """
+        return datetime(timestamp[5], timestamp[4], timestamp[3], timestamp[2], timestamp[1], timestamp[0])
+
+    @property
+    def created(self):
+        """Get the date and time the entry was created.
+
+        Returns:
+            datetime: The date and time the entry was created.
+        """
+        return Header.__toDatetime(self.__created)
+
+    @created.setter
+    def created(self, created):
+        """Set the date and time the entry was created.
+
+        Args:
+            created (datetime|tuple): The date and time the entry was created, or the raw timestamp fields.
+        """
+        self.__created = Header.__toTimestamp(created)
+
+    @property
+    def modified(self):
+        """Get the date and time the entry was last modified.
+
+        Returns:
+            datetime: The date and time the entry was last modified.
+        """
+        return Header.__toDatetime(self.__modified)
+
+    @modified.setter
+    def modified(self, modified):
+        """Set the date and time the entry was last modified.
+
+        Args:
+            modified (datetime|tuple): The date and time the entry was last modified, or the raw timestamp fields.
+        """
+        self.__modified = Header.__toTimestamp(modified)
+
     def serialize(self):
         """Serializes the header into a bytes data stream.
 
         Returns:
             bytes: The serialized header in a byte stream.
         """
-        return struct.pack(
-            Header.FORMAT,
+        return Header.STRUCT.pack(*self.__values())
+
+    def serializeInto(self, buffer, offset = 0):
+        """Serializes the header directly into the given writable buffer.
+
+        Args:
+            buffer (bytearray|memoryview): The writable buffer to serialize the header into.
+            offset (int, optional): The offset within the buffer where the header is written. Defaults to 0.
+
+        Returns:
+            int: The number of bytes written to the buffer.
+        """
+        Header.STRUCT.pack_into(buffer, offset, *self.__values())
+        return Header.SIZE
+
+    def __values(self):
+        """Gets the header values in the order of the binary structure.
+
+        Returns:
+            tuple: The values to be packed with the header format.
+        """
+        return (
             self.type,
             self.unk1,
             self.size,
             0,
-            self.created.second,
-            self.created.minute,
-            self.created.hour,
-            self.created.day,
-            self.created.month,
-            self.created.year,
+            *self.__created,
             self.sectorAddress,
             self.unk2,
             self.unk3,
             0,
-            self.modified.second,
-            self.modified.minute,
-            self.modified.hour,
-            self.modified.day,
-            self.modified.month,
-            self.modified.year
+            *self.__modified
         )
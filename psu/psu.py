@@ -1,6 +1,11 @@
-from .exceptions import EntryNotFoundException
+from .exceptions import EntryNotFoundException, EntryNotAFileException
 from .entry import Entry, File, Directory, Type
+from datetime import datetime
+import contextlib
+import mmap
 import os
+import stat
+import tempfile
 
 class PSU:
     @staticmethod
@@ -34,7 +39,15 @@ class PSU:
         """
         psu = PSU(filepath)
         with open(psu.filepath, 'rb') as f:
-            psu.__parse(f.read())
+            # Empty files cannot be memory mapped, and Windows cannot replace a mapped file when saving
+            if os.name == 'nt' or os.fstat(f.fileno()).st_size == 0:
+                psu.__parse(f.read())
+                return psu
+
+            # Map the file rather than reading it all into memory. File entries reference their content
+            # within the map, which stays open until no entry references it. Saving replaces the file
+            # rather than truncating it, so the map remains valid after a save to the same filepath.
+            psu.__parse(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
         return psu
 
     def __init__(self, filepath):
@@ -45,29 +58,104 @@ class PSU:
         """
         self.filepath = filepath
         self.entries = []
+        self.__reindex()
 
     def __parse(self, data):
         """Parses the PSU entries within the given data stream.
 
         Args:
-            data (bytes): The PSU file byte data stream.
+            data (bytes|mmap): The PSU file byte data stream.
 
         Returns:
             list(Entry): The parsed entries within the PSU instance.
         """
         self.entries = []
 
+        # Walk a single view of the data to avoid copying the remaining entries
+        view = memoryview(data)
+
+        # Bind the loop lookups once rather than per entry
+        deserialize = Entry.deserialize
+        append = self.entries.append
+        end = len(view)
+
         offset = 0
-        while offset < len(data):
+        while offset < end:
             # Parse the next entry
-            entry, size = Entry.deserialize(data[offset:])
-            self.entries.append(entry)
+            entry, size = deserialize(view, offset)
+            append(entry)
             offset += size
 
+        self.__reindex()
         return self.entries
 
+    def __reindex(self):
+        """Rebuilds the entry name to array index lookups from the list of entries.
+        The first entry is kept when multiple entries share the same name.
+        """
+        self.__indices = {}
+        self.__typedIndices = {}
+        for i in range(0, len(self.entries)):
+            self.__indices.setdefault(self.entries[i].name, i)
+            self.__typedIndices.setdefault((self.entries[i].name, self.entries[i].header.type), i)
+
+        # Record the state the lookups were built from
+        self.__indexedEntries = self.entries
+        self.__indexedLength = len(self.entries)
+
+    def __isIndexStale(self):
+        """Checks if the list of entries was replaced or resized since the lookups were built.
+
+        Returns:
+            bool: If the lookups need to be rebuilt.
+        """
+        return self.entries is not self.__indexedEntries or len(self.entries) != self.__indexedLength
+
+    def __find(self, entryName, type = None):
+        """Finds the array index of the first entry with the given name.
+        Entries renamed by assigning their name directly, or replaced in place within the list of entries, are only
+        detected when their previous name is looked up. Use rename() to rename entries.
+
+        Args:
+            entryName (str): The entry name to search for within the PSU.
+            type (Type): Restrict the search to only find entries of the given type. Defaults to None.
+
+        Returns:
+            integer|None: The array index the entry exists at, or None if the entry name was not found.
+        """
+        # Rebuild the lookups if entries were added or removed outside of the PSU instance
+        if self.__isIndexStale():
+            self.__reindex()
+
+        index = self.__lookup(entryName, type)
+
+        # Rebuild the lookups if the indexed entry was renamed or replaced
+        if index != None and (
+            index >= len(self.entries) or
+            self.entries[index].name != entryName or
+            (type != None and self.entries[index].header.type != type)
+        ):
+            self.__reindex()
+            index = self.__lookup(entryName, type)
+
+        return index
+
+    def __lookup(self, entryName, type = None):
+        """Gets the array index for the given entry name from the lookups without validating it.
+
+        Args:
+            entryName (str): The entry name to search for within the PSU.
+            type (Type): Restrict the search to only find entries of the given type. Defaults to None.
+
+        Returns:
+            integer|None: The array index the entry was indexed at, or None if the entry name was not indexed.
+        """
+        if type == None:
+            return self.__indices.get(entryName)
+        return self.__typedIndices.get((entryName, type))
+
     def __index(self, entryName, type = None):
-        """_summary_
+        """Gets the array index of the entry with the given name.
 
         Args:
             entryName (str): The entry name to search for within the PSU.
@@ -79,10 +167,10 @@ class PSU:
         Returns:
             integer: The array index the entry exists at.
         """
-        for i in range(0, len(self.entries)):
-            if self.entries[i].name == entryName and (type == None or self.entries[i].header.type == type):
-                return i
-        raise EntryNotFoundException(entryName)
+        index = self.__find(entryName, type)
+        if index == None:
+            raise EntryNotFoundException(entryName)
+        return index
 
     def add(self, entry):
         """Add an entry to the list of entries in the PSU.
@@ -90,7 +178,15 @@ class PSU:
         Args:
             entry (Entry): The entry to be added.
         """
+        # Stale lookups are rebuilt on the next search instead
+        if self.__isIndexStale():
+            self.entries.append(entry)
+            return
+
+        self.__indices.setdefault(entry.name, len(self.entries))
+        self.__typedIndices.setdefault((entry.name, entry.header.type), len(self.entries))
         self.entries.append(entry)
+        self.__indexedLength = len(self.entries)
 
     def write(self, entryName, data):
         """Write an existing or new entry to the PSU with the given data.
@@ -99,6 +195,9 @@ class PSU:
             entryName (str): The entry file name to be wrote.
             data (bytes|str): The entry file contents to be wrote.
 
+        Raises:
+            EntryNotAFileException: Exception is raised when the existing entry is not a file.
+
         Returns:
             Entry: The new or existing entry that has had the data wrote to it.
         """
@@ -108,8 +207,11 @@ class PSU:
             data = data.encode('UTF-8')
 
         # Update existing file entry
-        if self.has(entryName):
-            entry = self.get(entryName)
+        index = self.__find(entryName)
+        if index != None:
+            entry = self.entries[index]
+            if not entry.isFile():
+                raise EntryNotAFileException(entry)
             entry.content = data
             entry.header.size = len(data)
             return entry
@@ -134,28 +236,57 @@ class PSU:
         """Save the PSU instance to a file.
 
         Args:
-            filepath (str, optional): The destination filepath to save the PSU to. If none is provided, then the instance property filepath is used. Defaults to None.
+            filepath (str|PathLike, optional): The destination filepath to save the PSU to. If none is provided, then the instance property filepath is used. Defaults to None.
         """
         filepath = filepath if filepath != None else self.filepath
 
-        # Generate PSU file
-        data = b''
-        for entry in self.entries:
-            # Resolve directory sizes
-            if entry.header.type == Type.DIRECTORY:
-                if entry.name == '.' or entry.name == '..':
-                    # "." and ".." directories have 0 size
-                    entry.header.size = 0
-                else:
-                    # Other directories size are the number of entries
-                    entry.header.size = len(self.entries) - 1
-
-            # Serialize the entry
-            data += entry.serialize()
-
-        # Write data to file
-        with open(filepath, 'wb') as f:
-            f.write(data)
+        # Resolve symbolic links so the link is kept and its target is replaced
+        filepath = os.path.realpath(filepath)
+
+        # Other directories size are the number of entries
+        directorySize = len(self.entries) - 1
+
+        # Stream the PSU file entries to a temporary file alongside the destination, so a failed save leaves the destination intact
+        descriptor, temporaryFilepath = tempfile.mkstemp(
+            prefix=os.path.basename(filepath) + '.',
+            suffix='.tmp',
+            dir=os.path.dirname(filepath)
+        )
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                for entry in self.entries:
+                    # Resolve directory sizes, "." and ".." directories have 0 size
+                    if entry.isDirectory():
+                        entry.header.size = 0 if entry.name in ('.', '..') else directorySize
+
+                    # Serialize the entry
+                    entry.serializeTo(f)
+
+            # Replace the destination with the completed file, keeping the destination permissions
+            os.chmod(temporaryFilepath, PSU.__getFileMode(filepath))
+            os.replace(temporaryFilepath, filepath)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporaryFilepath)
+            raise
+
+    @staticmethod
+    def __getFileMode(filepath):
+        """Gets the permission bits of the given file, or the default permission bits for a new file.
+
+        Args:
+            filepath (str): The filepath to get the permission bits of.
+
+        Returns:
+            int: The file permission bits.
+        """
+        try:
+            return stat.S_IMODE(os.stat(filepath).st_mode)
+        except FileNotFoundError:
+            # New files are created with the default permissions, less the process umask
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
 
     def copy(self, filepath, entryName):
         """Import the given filepath file to the PSU instance identified by the entry name.
@@ -188,6 +319,27 @@ class PSU:
         index = self.__index(entryName)
         del self.entries[index]
 
+        # Following entries have shifted down an index
+        self.__reindex()
+
+    def rename(self, entryName, newName):
+        """Renames the given entry within the list of entries, keeping the entry name lookups up to date.
+
+        Args:
+            entryName (str): The existing entry name to be renamed.
+            newName (str): The new entry name.
+
+        Raises:
+            EntryNotFoundException: Exception is raised when the given entry name was not found in the PSU instance.
+
+        Returns:
+            Entry: The renamed entry.
+        """
+        entry = self.get(entryName)
+        entry.name = newName
+        self.__reindex()
+        return entry
+
     def list(self):
         """Gets the entries associated with the PSU instance.
 
@@ -220,11 +372,7 @@ class PSU:
         Returns:
             bool: If the entry name exists within the PSU instance.
         """
-        try:
-            self.get(entryName)
-            return True
-        except EntryNotFoundException:
-            return False
+        return self.__find(entryName) != None
 
     def isFile(self, entryName):
         """Is the given entry name a file?
@@ -260,7 +408,10 @@ class PSU:
         Returns:
             str: A string containing a list of files and directories within the PSU instance.
         """
+        # Only retrieve the current year once for all entries
+        currentYear = datetime.now().year
+
         value = f'total {len(self.list())}\n'
         for entry in self.list():
-            value += f'{entry}\n'
+            value += f'{entry.toString(currentYear)}\n'
         return value
\ No newline at end of file
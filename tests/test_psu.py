@@ -0,0 +1,153 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from psu.psu import PSU
+from psu.entry import File, Type
+from psu.exceptions import EntryNotFoundException
+
+class TestEntryLookup(unittest.TestCase):
+    def setUp(self):
+        self.psu = PSU.create('BASCUS-97129.psu')
+        self.psu.write('a.txt', 'a')
+        self.psu.write('b.txt', 'b')
+
+    def test_add(self):
+        self.psu.add(File('c.txt', b'c'))
+        self.assertTrue(self.psu.has('c.txt'))
+        self.assertEqual(self.psu.read('c.txt'), b'c')
+
+    def test_write_existing(self):
+        self.psu.write('a.txt', 'new')
+        self.assertEqual(self.psu.read('a.txt'), b'new')
+        self.assertEqual(len(self.psu.list()), 5)
+
+    def test_missing(self):
+        self.assertFalse(self.psu.has('missing.txt'))
+        with self.assertRaises(EntryNotFoundException):
+            self.psu.get('missing.txt')
+
+    def test_delete(self):
+        self.psu.delete('a.txt')
+        self.assertFalse(self.psu.has('a.txt'))
+        self.assertEqual(self.psu.read('b.txt'), b'b')
+
+    def test_rename(self):
+        self.psu.rename('a.txt', 'c.txt')
+        self.assertFalse(self.psu.has('a.txt'))
+        self.assertEqual(self.psu.read('c.txt'), b'a')
+
+    def test_rename_to_existing_name(self):
+        # The first entry with a name is found, matching a linear search
+        self.psu.rename('b.txt', 'a.txt')
+        self.assertEqual(self.psu.read('a.txt'), b'a')
+
+    def test_direct_rename(self):
+        # Direct renames are detected when the previous name is looked up
+        self.psu.get('a.txt').name = 'c.txt'
+        self.assertFalse(self.psu.has('a.txt'))
+        self.assertEqual(self.psu.read('c.txt'), b'a')
+
+    def test_entries_append(self):
+        self.psu.list().append(File('c.txt', b'c'))
+        self.assertTrue(self.psu.has('c.txt'))
+        self.psu.write('c.txt', 'new')
+        self.assertEqual([entry.name for entry in self.psu.list()].count('c.txt'), 1)
+
+    def test_entries_replaced(self):
+        self.psu.entries = [File('c.txt', b'c')]
+        self.assertTrue(self.psu.has('c.txt'))
+        self.assertFalse(self.psu.has('a.txt'))
+
+    def test_type_filter(self):
+        self.psu.add(File('.', b'dot'))
+        self.assertTrue(self.psu.isDirectory('.'))
+        self.assertEqual(self.psu.get('.', Type.FILE).content, b'dot')
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'BASCUS-97129.psu')
+            self.psu.save(filepath)
+            psu = PSU.load(filepath)
+            self.assertEqual([entry.name for entry in psu.list()], [entry.name for entry in self.psu.list()])
+            self.assertEqual(psu.read('b.txt'), b'b')
+
+class TestSerialize(unittest.TestCase):
+    def test_serialize(self):
+        entry = File('a.txt', b'a')
+        data = entry.serialize()
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(len(data), entry.serializedSize())
+        self.assertEqual(len(data), 512 + File.PAGE_SIZE)
+        self.assertEqual(data[512:513], b'a')
+
+
+class TestSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, 'BASCUS-97129.psu')
+        self.psu = PSU.create(self.filepath)
+        self.psu.write('a.txt', 'a')
+        self.psu.save()
+        with open(self.filepath, 'rb') as f:
+            self.data = f.read()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        PSU.load(self.filepath).save()
+        with open(self.filepath, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertEqual(os.listdir(self.directory.name), ['BASCUS-97129.psu'])
+
+    def test_read_after_save(self):
+        psu = PSU.load(self.filepath)
+        psu.write('b.txt', 'b')
+        psu.save()
+        self.assertEqual(psu.read('a.txt'), b'a')
+        self.assertEqual(PSU.load(self.filepath).read('b.txt'), b'b')
+
+    def test_empty_file(self):
+        open(self.filepath, 'wb').close()
+        self.assertEqual(PSU.load(self.filepath).list(), [])
+
+    def test_failed_save_keeps_file(self):
+        psu = PSU.load(self.filepath)
+        psu.get('a.txt').header.sectorAddress = 70000
+        with self.assertRaises(Exception):
+            psu.save()
+        with open(self.filepath, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertEqual(os.listdir(self.directory.name), ['BASCUS-97129.psu'])
+
+    def test_path(self):
+        PSU.load(self.filepath).save(pathlib.Path(self.filepath))
+        with open(self.filepath, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_existing_temporary_file(self):
+        temporaryFilepath = self.filepath + '.tmp'
+        with open(temporaryFilepath, 'wb') as f:
+            f.write(b'unrelated')
+        PSU.load(self.filepath).save()
+        with open(temporaryFilepath, 'rb') as f:
+            self.assertEqual(f.read(), b'unrelated')
+
+    def test_missing_directory(self):
+        with self.assertRaises(FileNotFoundError) as context:
+            self.psu.save(os.path.join(self.directory.name, 'missing', 'BASCUS-97129.psu'))
+        self.assertIsNone(context.exception.__context__)
+
+    @unittest.skipUnless(os.name == 'posix', 'requires POSIX symbolic links and permissions')
+    def test_symlink_and_mode(self):
+        os.chmod(self.filepath, 0o640)
+        link = os.path.join(self.directory.name, 'link.psu')
+        os.symlink(self.filepath, link)
+        PSU.load(link).save()
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(os.stat(self.filepath).st_mode & 0o777, 0o640)
+
+
+if __name__ == '__main__':
+    unittest.main()